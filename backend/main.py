@@ -1,21 +1,77 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
-from typing import List, Optional
-from datetime import datetime
-from enum import Enum
-import uuid
+# Request handlers are `async def` and run directly on the event loop, so they
+# must not do blocking I/O. Use aiofiles, or move the work into a plain `def`
+# helper run through Starlette's threadpool. `ruff check .` catches open() and
+# os.path calls in async functions (ASYNC230/ASYNC240, see ruff.toml); it does
+# not catch shutil or other os file calls, so review those by hand.
+
+import asyncio
+import gzip
+import hashlib
+import io
+import itertools
+import logging
 import os
+import re
 import shutil
-from pathlib import Path
+import sys
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Generic, List, NamedTuple, Optional, TypeVar
 
-app = FastAPI(title="Design Review System API", version="1.0.0")
+import aiofiles.os
+import orjson
+from fastapi import FastAPI, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic.dataclasses import dataclass
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background writer for uploads (see upload_file / _drain_uploads)
+    app.state.upload_queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+    upload_task = asyncio.create_task(_drain_uploads(app.state.upload_queue))
+    yield
+    await app.state.upload_queue.join()
+    upload_task.cancel()
+
+app = FastAPI(
+    title="Design Review System API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Create uploads directory
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_QUEUE_SIZE = 16
+# Uploads are written under this suffix and renamed into place once complete
+UPLOAD_PARTIAL_SUFFIX = ".part"
+# Stored names are <uuid hex><suffix>; other client suffixes (and .part) are
+# dropped so the name is always safe to put in a URL or X-Accel-Redirect header
+UPLOAD_SUFFIX_RE = re.compile(r"\.[A-Za-z0-9]{1,10}")
+# Behind nginx, set UPLOADS_X_ACCEL_REDIRECT=1: /download/{filename} then only
+# hands the path to the proxy, which serves UPLOAD_DIR itself with sendfile.
+UPLOADS_VIA_X_ACCEL = os.getenv("UPLOADS_X_ACCEL_REDIRECT", "0") == "1"
+
+# Pagination defaults for list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+# Response compression
+GZIP_MINIMUM_SIZE = 1024
+GZIP_COMPRESSLEVEL = 5
 
 # CORS middleware for React frontend
 app.add_middleware(
@@ -26,8 +82,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files for serving PDFs
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+class APIGZipMiddleware(GZipMiddleware):
+    """GZip responses except uploaded files, which are already compressed PDFs."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(("/uploads/", "/download/")):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Cached list pages carry their own precompressed body (see _cached_response);
+# GZipMiddleware skips responses that already set Content-Encoding.
+app.add_middleware(APIGZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESSLEVEL)
+
+# Mount static files for serving PDFs in development; behind nginx the proxy
+# serves /uploads/ as an internal location instead
+if not UPLOADS_VIA_X_ACCEL:
+    app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
 # ==================== Models ====================
 
@@ -52,13 +123,24 @@ class ReviewStatus(str, Enum):
     REJECTED = "rejected"
     NEEDS_REVISION = "needs_revision"
 
-class User(BaseModel):
+# Leaf models are immutable dataclasses; on Python 3.10+ they are slotted too
+# (no per-instance __dict__). pydantic ignores slots=True on older versions.
+@dataclass(frozen=True, slots=True)
+class User:
     id: str
     name: str
     email: str
     role: UserRole
     avatar: Optional[str] = None
 
+@dataclass(frozen=True, slots=True)
+class Position:
+    x: float
+    y: float
+    width: float
+    height: float
+    page: Optional[int] = None
+
 class Annotation(BaseModel):
     id: str
     drawing_id: str
@@ -66,19 +148,22 @@ class Annotation(BaseModel):
     type: AnnotationType
     author: User
     content: str
-    position: dict  # {x, y, width, height}
+    position: Position
     created_at: datetime
     updated_at: datetime
     resolved: bool = False
     replies: List['AnnotationReply'] = []
 
-class AnnotationReply(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AnnotationReply:
     id: str
     author: User
     content: str
     created_at: datetime
 
 class Version(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     version_number: int
     created_at: datetime
@@ -105,6 +190,24 @@ class Project(BaseModel):
     team_members: List[User]
     created_at: datetime
 
+# List endpoints return summaries; the detail endpoints return the full models
+class ProjectSummary(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    drawing_count: int
+    member_count: int
+    created_at: datetime
+
+class DrawingSummary(BaseModel):
+    id: str
+    title: str
+    description: Optional[str] = None
+    project_id: str
+    current_version: Version
+    created_at: datetime
+    updated_at: datetime
+
 class ReviewWorkflow(BaseModel):
     id: str
     drawing_id: str
@@ -115,6 +218,14 @@ class ReviewWorkflow(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime] = None
 
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    total: int
+    offset: int
+    limit: int
+    data: List[T]
+
 # ==================== Mock Data ====================
 
 # Mock users
@@ -209,7 +320,7 @@ DRAWINGS = [
 PROJECTS[0].drawings = DRAWINGS
 
 # Mock annotations
-ANNOTATIONS = [
+_SEED_ANNOTATIONS = [
     Annotation(
         id="ann-1",
         drawing_id="draw-1",
@@ -271,6 +382,218 @@ WORKFLOWS = [
     )
 ]
 
+# Lookup indexes (id -> object), kept in sync with the lists above
+USERS_BY_ID = {u.id: u for u in USERS}
+_DEFAULT_USER = USERS[0]  # fallback author when a request names an unknown user
+PROJECTS_BY_ID = {p.id: p for p in PROJECTS}
+DRAWINGS_BY_ID = {d.id: d for d in DRAWINGS}
+ANNOTATIONS_BY_ID = {}  # populated by _index_annotation below
+WORKFLOWS_BY_ID = {w.id: w for w in WORKFLOWS}
+
+WORKFLOWS_BY_DRAWING = defaultdict(list)
+for _workflow in WORKFLOWS:
+    WORKFLOWS_BY_DRAWING[_workflow.drawing_id].append(_workflow)
+
+# Annotations grouped by drawing and by (drawing, version), insertion order
+# preserved. These indexes and ANNOTATIONS_BY_ID are the source of truth;
+# _SEED_ANNOTATIONS is only read below to build them and the id sequences.
+ANNOTATIONS_BY_DRAWING = defaultdict(list)
+ANNOTATIONS_BY_DRAWING_VERSION = defaultdict(lambda: defaultdict(list))
+
+def _index_annotation(annotation: Annotation):
+    ANNOTATIONS_BY_ID[annotation.id] = annotation
+    ANNOTATIONS_BY_DRAWING[annotation.drawing_id].append(annotation)
+    ANNOTATIONS_BY_DRAWING_VERSION[annotation.drawing_id][annotation.version_id].append(annotation)
+
+def _unindex_annotation(annotation: Annotation):
+    del ANNOTATIONS_BY_ID[annotation.id]
+    ANNOTATIONS_BY_DRAWING[annotation.drawing_id].remove(annotation)
+    ANNOTATIONS_BY_DRAWING_VERSION[annotation.drawing_id][annotation.version_id].remove(annotation)
+
+for _annotation in _SEED_ANNOTATIONS:
+    _index_annotation(_annotation)
+
+# Monotonic id sequences; ids are never reused after a delete
+_annotation_id_seq = itertools.count(len(_SEED_ANNOTATIONS) + 1)
+_reply_id_seq = itertools.count(sum(len(a.replies) for a in _SEED_ANNOTATIONS) + 1)
+_version_number_seq = {d.id: itertools.count(len(d.versions) + 1) for d in DRAWINGS}
+
+# One lock per collection, held around each mutation so a future `await` inside
+# a handler can't interleave two writers. State is still per-process: running
+# several uvicorn workers needs a shared store instead.
+_annotations_lock = asyncio.Lock()
+_drawings_lock = asyncio.Lock()
+_workflows_lock = asyncio.Lock()
+
+# ==================== Response Cache ====================
+
+def _etag(payload: bytes) -> str:
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+class CachedBody(NamedTuple):
+    payload: bytes
+    etag: str
+    gzipped: Optional[bytes] = None
+
+def _build_body(payload: bytes, compress: bool = True) -> CachedBody:
+    gzipped = None
+    if compress and len(payload) >= GZIP_MINIMUM_SIZE:
+        gzipped = gzip.compress(payload, compresslevel=GZIP_COMPRESSLEVEL, mtime=0)
+    return CachedBody(payload, _etag(payload), gzipped)
+
+class ResponseCache:
+    """Serialized JSON bodies for read-mostly endpoints.
+
+    Each key holds one CachedBody (payload, ETag and gzipped payload) per
+    variant (e.g. a page of a list endpoint), so hashing and compression run
+    once per build. Entries are built on first request and dropped, all
+    variants at once, by the mutating endpoints that change the underlying data.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def get_or_build(self, key: str, builder, variant=None) -> CachedBody:
+        variants = self._entries.setdefault(key, {})
+        entry = variants.get(variant)
+        if entry is None:
+            entry = variants[variant] = _build_body(builder())
+        return entry
+
+    def invalidate(self, *keys: str):
+        for key in keys:
+            self._entries.pop(key, None)
+
+_cache = ResponseCache()
+
+def _json_response(payload: bytes) -> Response:
+    return Response(content=payload, media_type="application/json")
+
+def _cached_response(request: Request, body: CachedBody) -> Response:
+    content, headers = body.payload, {"ETag": body.etag}
+    if body.gzipped is not None:
+        headers["Vary"] = "Accept-Encoding"
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            # Each representation gets its own strong ETag
+            content = body.gzipped
+            headers["ETag"] = body.etag[:-1] + '-gzip"'
+            headers["Content-Encoding"] = "gzip"
+    etag = headers["ETag"]
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if "*" in tags or etag in tags or f"W/{etag}" in tags:
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+def _model_json(model: BaseModel, **dump_kwargs) -> bytes:
+    # OPT_UTC_Z matches pydantic's "Z" suffix for UTC timestamps
+    return orjson.dumps(model.model_dump(**dump_kwargs), option=orjson.OPT_UTC_Z)
+
+def _extend_object(head: bytes, **fields: bytes) -> bytes:
+    """Append already-serialized fields to a serialized JSON object."""
+    tail = b"".join(b',"%s":%b' % (name.encode(), value) for name, value in fields.items())
+    return head[:-1] + tail + b"}"
+
+# Per-object JSON fragments. Versions are shared between drawings (and drawing
+# summaries between list and detail responses), so each is encoded once and
+# spliced in.
+_VERSION_JSON = {}
+_DRAWING_SUMMARY_JSON = {}
+_DRAWING_JSON = {}
+_PROJECT_JSON = {}
+
+def _version_json(version: Version) -> bytes:
+    payload = _VERSION_JSON.get(version.id)
+    if payload is None:
+        payload = _VERSION_JSON[version.id] = _model_json(version)
+    return payload
+
+def _drawing_summary_json(drawing: Drawing) -> bytes:
+    payload = _DRAWING_SUMMARY_JSON.get(drawing.id)
+    if payload is None:
+        payload = _DRAWING_SUMMARY_JSON[drawing.id] = _extend_object(
+            _model_json(drawing, exclude={"current_version", "versions"}),
+            current_version=_version_json(drawing.current_version),
+        )
+    return payload
+
+def _drawing_json(drawing: Drawing) -> bytes:
+    payload = _DRAWING_JSON.get(drawing.id)
+    if payload is None:
+        payload = _DRAWING_JSON[drawing.id] = _extend_object(
+            _drawing_summary_json(drawing),
+            versions=_versions_json(drawing.versions),
+        )
+    return payload
+
+def _project_json(project: Project) -> bytes:
+    payload = _PROJECT_JSON.get(project.id)
+    if payload is None:
+        payload = _PROJECT_JSON[project.id] = _extend_object(
+            _model_json(project, exclude={"drawings"}),
+            drawings=_drawings_json(project.drawings),
+        )
+    return payload
+
+def _versions_json(versions: List[Version]) -> bytes:
+    return b"[" + b",".join(_version_json(v) for v in versions) + b"]"
+
+def _drawings_json(drawings: List[Drawing]) -> bytes:
+    return b"[" + b",".join(_drawing_json(d) for d in drawings) + b"]"
+
+def _drawing_summaries_json(drawings: List[Drawing]) -> bytes:
+    return b"[" + b",".join(_drawing_summary_json(d) for d in drawings) + b"]"
+
+def _project_summaries_json(projects: List[Project]) -> bytes:
+    return PROJECT_SUMMARIES_ADAPTER.dump_json([
+        ProjectSummary(
+            id=p.id,
+            name=p.name,
+            description=p.description,
+            drawing_count=len(p.drawings),
+            member_count=len(p.team_members),
+            created_at=p.created_at,
+        )
+        for p in projects
+    ])
+
+# Models without shared fragments are encoded a page at a time in pydantic-core
+PROJECT_SUMMARIES_ADAPTER = TypeAdapter(List[ProjectSummary])
+ANNOTATIONS_ADAPTER = TypeAdapter(List[Annotation])
+WORKFLOWS_ADAPTER = TypeAdapter(List[ReviewWorkflow])
+USERS_ADAPTER = TypeAdapter(List[User])
+
+def _dump_page(items: list, offset: int, limit: int, dump_list) -> bytes:
+    data = dump_list(items[offset:offset + limit])
+    return b'{"total":%d,"offset":%d,"limit":%d,"data":%b}' % (len(items), offset, limit, data)
+
+def _page_response(request: Request, key: Optional[str], items: list, offset: int, limit: int, dump_list) -> Response:
+    # Only pages on the DEFAULT_PAGE_SIZE / MAX_PAGE_SIZE grid are cached, so a
+    # collection holds at most a few pages per item in the cache. Any other
+    # offset/limit pair, pages past the end and lookups without a cache key
+    # (unknown ids) are built per request.
+    cacheable = (
+        key is not None
+        and limit in (DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        and offset % limit == 0
+        and (offset == 0 or offset < len(items))
+    )
+    if not cacheable:
+        body = _build_body(_dump_page(items, offset, limit, dump_list), compress=False)
+        return _cached_response(request, body)
+    body = _cache.get_or_build(
+        key, lambda: _dump_page(items, offset, limit, dump_list), variant=(offset, limit)
+    )
+    return _cached_response(request, body)
+
+def _invalidate_annotation(annotation: Annotation):
+    _cache.invalidate(
+        f"annotations:{annotation.drawing_id}",
+        f"annotations:{annotation.drawing_id}:{annotation.version_id}",
+    )
+
 # ==================== API Endpoints ====================
 
 @app.get("/")
@@ -282,160 +605,326 @@ async def root():
     }
 
 # Projects
-@app.get("/api/projects", response_model=List[Project])
-async def get_projects():
-    return PROJECTS
+@app.get("/api/projects", response_model=Page[ProjectSummary])
+async def get_projects(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    # Returning a Response skips response_model validation and jsonable_encoder;
+    # response_model is kept for the OpenAPI schema.
+    return _page_response(request, "projects", PROJECTS, offset, limit, _project_summaries_json)
 
 @app.get("/api/projects/{project_id}", response_model=Project)
 async def get_project(project_id: str):
-    project = next((p for p in PROJECTS if p.id == project_id), None)
+    project = PROJECTS_BY_ID.get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    return _json_response(_project_json(project))
 
 # Drawings
-@app.get("/api/drawings", response_model=List[Drawing])
-async def get_drawings(project_id: Optional[str] = None):
+@app.get("/api/drawings", response_model=Page[DrawingSummary])
+async def get_drawings(
+    request: Request,
+    project_id: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
     if project_id:
-        return [d for d in DRAWINGS if d.project_id == project_id]
-    return DRAWINGS
+        project = PROJECTS_BY_ID.get(project_id)
+        if not project:
+            return _page_response(request, None, [], offset, limit, _drawing_summaries_json)
+        return _page_response(request, f"drawings:{project_id}", project.drawings, offset, limit, _drawing_summaries_json)
+    return _page_response(request, "drawings", DRAWINGS, offset, limit, _drawing_summaries_json)
 
 @app.get("/api/drawings/{drawing_id}", response_model=Drawing)
 async def get_drawing(drawing_id: str):
-    drawing = next((d for d in DRAWINGS if d.id == drawing_id), None)
+    drawing = DRAWINGS_BY_ID.get(drawing_id)
     if not drawing:
         raise HTTPException(status_code=404, detail="Drawing not found")
-    return drawing
+    return _json_response(_drawing_json(drawing))
 
 # Annotations
-@app.get("/api/drawings/{drawing_id}/annotations", response_model=List[Annotation])
-async def get_annotations(drawing_id: str, version_id: Optional[str] = None):
-    annotations = [a for a in ANNOTATIONS if a.drawing_id == drawing_id]
+@app.get("/api/drawings/{drawing_id}/annotations", response_model=Page[Annotation])
+async def get_annotations(
+    request: Request,
+    drawing_id: str,
+    version_id: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    by_version = ANNOTATIONS_BY_DRAWING_VERSION.get(drawing_id)
+    if by_version is None or (version_id and version_id not in by_version):
+        return _page_response(request, None, [], offset, limit, ANNOTATIONS_ADAPTER.dump_json)
     if version_id:
-        annotations = [a for a in annotations if a.version_id == version_id]
-    return annotations
+        key = f"annotations:{drawing_id}:{version_id}"
+        annotations = by_version[version_id]
+    else:
+        key = f"annotations:{drawing_id}"
+        annotations = ANNOTATIONS_BY_DRAWING[drawing_id]
+    return _page_response(request, key, annotations, offset, limit, ANNOTATIONS_ADAPTER.dump_json)
 
 class CreateAnnotationRequest(BaseModel):
     drawing_id: str
     version_id: str
     type: AnnotationType
     content: str
-    position: dict
+    position: Position
     author_id: Optional[str] = "user-1"
 
 @app.post("/api/annotations", response_model=Annotation)
 async def create_annotation(request: CreateAnnotationRequest):
-    author = next((u for u in USERS if u.id == request.author_id), USERS[0])
+    author = USERS_BY_ID.get(request.author_id, _DEFAULT_USER)
+    now = datetime.now(timezone.utc)
     new_annotation = Annotation(
-        id=f"ann-{len(ANNOTATIONS) + 1}",
+        id=f"ann-{next(_annotation_id_seq)}",
         drawing_id=request.drawing_id,
         version_id=request.version_id,
         type=request.type,
         author=author,
         content=request.content,
         position=request.position,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
         resolved=False,
         replies=[]
     )
-    ANNOTATIONS.append(new_annotation)
+    async with _annotations_lock:
+        _index_annotation(new_annotation)
+        _invalidate_annotation(new_annotation)
     return new_annotation
 
 @app.put("/api/annotations/{annotation_id}/resolve")
 async def resolve_annotation(annotation_id: str):
-    annotation = next((a for a in ANNOTATIONS if a.id == annotation_id), None)
-    if not annotation:
-        raise HTTPException(status_code=404, detail="Annotation not found")
-    annotation.resolved = True
+    async with _annotations_lock:
+        annotation = ANNOTATIONS_BY_ID.get(annotation_id)
+        if not annotation:
+            raise HTTPException(status_code=404, detail="Annotation not found")
+        annotation.resolved = True
+        _invalidate_annotation(annotation)
     return annotation
 
 @app.put("/api/annotations/{annotation_id}/unresolve")
 async def unresolve_annotation(annotation_id: str):
-    annotation = next((a for a in ANNOTATIONS if a.id == annotation_id), None)
-    if not annotation:
-        raise HTTPException(status_code=404, detail="Annotation not found")
-    annotation.resolved = False
+    async with _annotations_lock:
+        annotation = ANNOTATIONS_BY_ID.get(annotation_id)
+        if not annotation:
+            raise HTTPException(status_code=404, detail="Annotation not found")
+        annotation.resolved = False
+        _invalidate_annotation(annotation)
     return annotation
 
 @app.delete("/api/annotations/{annotation_id}")
 async def delete_annotation(annotation_id: str):
-    global ANNOTATIONS
-    annotation = next((a for a in ANNOTATIONS if a.id == annotation_id), None)
-    if not annotation:
-        raise HTTPException(status_code=404, detail="Annotation not found")
-    ANNOTATIONS = [a for a in ANNOTATIONS if a.id != annotation_id]
+    async with _annotations_lock:
+        annotation = ANNOTATIONS_BY_ID.get(annotation_id)
+        if not annotation:
+            raise HTTPException(status_code=404, detail="Annotation not found")
+        _unindex_annotation(annotation)
+        _invalidate_annotation(annotation)
     return {"message": "Annotation deleted successfully", "id": annotation_id}
 
-@app.post("/api/annotations/{annotation_id}/replies", response_model=Annotation)
-async def add_reply(annotation_id: str, content: str, author_id: str = "user-1"):
-    annotation = next((a for a in ANNOTATIONS if a.id == annotation_id), None)
-    if not annotation:
-        raise HTTPException(status_code=404, detail="Annotation not found")
-    
-    author = next((u for u in USERS if u.id == author_id), USERS[0])
-    reply = AnnotationReply(
-        id=f"reply-{len(annotation.replies) + 1}",
-        author=author,
-        content=content,
-        created_at=datetime.now()
+class AddReplyRequest(BaseModel):
+    content: str
+    author_id: Optional[str] = "user-1"
+
+class BatchReplyRequest(AddReplyRequest):
+    annotation_id: str
+
+def _new_reply(request: AddReplyRequest, now: datetime) -> AnnotationReply:
+    return AnnotationReply(
+        id=f"reply-{next(_reply_id_seq)}",
+        author=USERS_BY_ID.get(request.author_id, _DEFAULT_USER),
+        content=request.content,
+        created_at=now
     )
-    annotation.replies.append(reply)
+
+@app.post("/api/annotations/replies:batch", response_model=List[Annotation])
+async def create_replies_batch(requests: List[BatchReplyRequest]):
+    now = datetime.now(timezone.utc)
+    async with _annotations_lock:
+        # Resolve every target first so a bad id rejects the whole batch
+        annotations = {}
+        for request in requests:
+            annotation = ANNOTATIONS_BY_ID.get(request.annotation_id)
+            if not annotation:
+                raise HTTPException(status_code=404, detail=f"Annotation not found: {request.annotation_id}")
+            annotations[annotation.id] = annotation
+
+        for request in requests:
+            annotations[request.annotation_id].replies.append(_new_reply(request, now))
+        for annotation in annotations.values():
+            _invalidate_annotation(annotation)
+    return list(annotations.values())
+
+@app.post("/api/annotations/{annotation_id}/replies", response_model=Annotation)
+async def add_reply(annotation_id: str, request: AddReplyRequest):
+    async with _annotations_lock:
+        annotation = ANNOTATIONS_BY_ID.get(annotation_id)
+        if not annotation:
+            raise HTTPException(status_code=404, detail="Annotation not found")
+        annotation.replies.append(_new_reply(request, datetime.now(timezone.utc)))
+        _invalidate_annotation(annotation)
     return annotation
 
 # Versions
 @app.get("/api/drawings/{drawing_id}/versions", response_model=List[Version])
 async def get_versions(drawing_id: str):
-    drawing = next((d for d in DRAWINGS if d.id == drawing_id), None)
+    drawing = DRAWINGS_BY_ID.get(drawing_id)
     if not drawing:
         raise HTTPException(status_code=404, detail="Drawing not found")
-    return drawing.versions
+    return _json_response(_versions_json(drawing.versions))
 
 # Workflows
-@app.get("/api/workflows", response_model=List[ReviewWorkflow])
-async def get_workflows(drawing_id: Optional[str] = None):
+@app.get("/api/workflows", response_model=Page[ReviewWorkflow])
+async def get_workflows(
+    request: Request,
+    drawing_id: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
     if drawing_id:
-        return [w for w in WORKFLOWS if w.drawing_id == drawing_id]
-    return WORKFLOWS
+        workflows = WORKFLOWS_BY_DRAWING.get(drawing_id)
+        if workflows is None:
+            return _page_response(request, None, [], offset, limit, WORKFLOWS_ADAPTER.dump_json)
+        return _page_response(request, f"workflows:{drawing_id}", workflows, offset, limit, WORKFLOWS_ADAPTER.dump_json)
+    return _page_response(request, "workflows", WORKFLOWS, offset, limit, WORKFLOWS_ADAPTER.dump_json)
 
 @app.put("/api/workflows/{workflow_id}/status")
 async def update_workflow_status(workflow_id: str, status: ReviewStatus):
-    workflow = next((w for w in WORKFLOWS if w.id == workflow_id), None)
+    workflow = WORKFLOWS_BY_ID.get(workflow_id)
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
-    workflow.status = status
-    if status in [ReviewStatus.APPROVED, ReviewStatus.REJECTED]:
-        workflow.completed_at = datetime.now()
+    async with _workflows_lock:
+        workflow.status = status
+        if status in [ReviewStatus.APPROVED, ReviewStatus.REJECTED]:
+            workflow.completed_at = datetime.now(timezone.utc)
+        _cache.invalidate("workflows", f"workflows:{workflow.drawing_id}")
     return workflow
 
 # Users
-@app.get("/api/users", response_model=List[User])
-async def get_users():
-    return USERS
+@app.get("/api/users", response_model=Page[User])
+async def get_users(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    return _page_response(request, "users", USERS, offset, limit, USERS_ADAPTER.dump_json)
 
 @app.get("/api/users/me", response_model=User)
 async def get_current_user():
     return USERS[0]  # Mock current user
 
 # File Upload
-@app.post("/api/upload")
-async def upload_file(file: UploadFile = File(...)):
+# Uploads are acknowledged as soon as they are received and written to
+# UPLOAD_DIR by a background task; clients poll HEAD /api/uploads/{filename}.
+PENDING_UPLOADS = set()
+
+def _copy_upload(source, target):
+    # Starlette spools uploads over 1 MB to a real temp file; on Linux those
+    # are copied kernel-side with sendfile. `_rolled` is private to
+    # SpooledTemporaryFile, so it is only a hint: without a usable descriptor
+    # fall back to a chunked copy.
+    src_fd = None
+    if getattr(source, "_rolled", False) and sys.platform.startswith("linux"):
+        try:
+            src_fd = source.fileno()
+            size = os.fstat(src_fd).st_size
+        except (AttributeError, OSError, ValueError):
+            src_fd = None
+    if src_fd is None:
+        shutil.copyfileobj(source, target, UPLOAD_CHUNK_SIZE)
+        return
+
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(target.fileno(), src_fd, offset, size - offset)
+        if sent == 0:
+            # The file shrank after fstat; without this the loop never ends
+            raise OSError(f"Upload truncated at {offset} of {size} bytes")
+        offset += sent
+
+def _write_upload(source, file_path: Path):
+    # Runs in a worker thread. The file only appears under its final name once
+    # fully written, so a failed write never leaves a truncated upload behind.
+    partial_path = file_path.with_name(file_path.name + UPLOAD_PARTIAL_SUFFIX)
+    source.seek(0)
+    try:
+        with open(partial_path, "wb") as target:
+            _copy_upload(source, target)
+        os.replace(partial_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(partial_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+async def _drain_uploads(queue: asyncio.Queue):
+    while True:
+        source, file_path = await queue.get()
+        try:
+            await run_in_threadpool(_write_upload, source, file_path)
+        except Exception:
+            logger.exception("Failed to write upload %s", file_path.name)
+        finally:
+            await run_in_threadpool(source.close)
+            PENDING_UPLOADS.discard(file_path.name)
+            queue.task_done()
+
+@app.post("/api/upload", status_code=202)
+async def upload_file(request: Request, file: UploadFile = File(...)):
     # Generate unique filename
-    file_extension = os.path.splitext(file.filename)[1]
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    file_path = UPLOAD_DIR / unique_filename
+    file_extension = PurePath(file.filename).suffix
+    if not UPLOAD_SUFFIX_RE.fullmatch(file_extension) or file_extension == UPLOAD_PARTIAL_SUFFIX:
+        file_extension = ""
+    unique_filename = f"{uuid.uuid4().hex}{file_extension}"
 
-    # Save file
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # FastAPI closes the form's files once the response is sent, so take the
+    # spooled upload for the writer and leave an empty placeholder to close.
+    source, file.file = file.file, io.BytesIO()
+    PENDING_UPLOADS.add(unique_filename)
+    await request.app.state.upload_queue.put((source, UPLOAD_DIR / unique_filename))
 
     return {
         "filename": unique_filename,
         "original_filename": file.filename,
-        "url": f"/uploads/{unique_filename}",
-        "full_url": f"http://localhost:8000/uploads/{unique_filename}"
+        "url": f"/download/{unique_filename}",
+        "full_url": f"http://localhost:8000/download/{unique_filename}",
+        "status": "pending"
     }
 
+async def _uploaded_file(filename: str) -> Optional[Path]:
+    # Only plain names of finished uploads, so no path can escape UPLOAD_DIR
+    if (
+        filename in PENDING_UPLOADS
+        or filename.endswith(UPLOAD_PARTIAL_SUFFIX)
+        or PurePath(filename).name != filename
+    ):
+        return None
+    file_path = UPLOAD_DIR / filename
+    return file_path if await aiofiles.os.path.isfile(file_path) else None
+
+@app.head("/api/uploads/{filename}")
+async def get_upload_status(filename: str):
+    # 202 while the background writer still owns the file, 200 once it is
+    # served, 404 if the write failed (or the name was never uploaded)
+    if filename in PENDING_UPLOADS:
+        return Response(status_code=202)
+    if not await _uploaded_file(filename):
+        return Response(status_code=404)
+    return Response(status_code=200)
+
+@app.get("/download/{filename}")
+async def download_file(filename: str):
+    file_path = await _uploaded_file(filename)
+    if not file_path:
+        raise HTTPException(status_code=404, detail="File not found")
+    if UPLOADS_VIA_X_ACCEL:
+        # nginx sends the file from its internal /uploads/ location
+        return Response(headers={"X-Accel-Redirect": f"/uploads/{filename}"})
+    return FileResponse(file_path)
+
 class CreateVersionRequest(BaseModel):
     file_url: str
     changes_summary: Optional[str] = None
@@ -444,29 +933,45 @@ class CreateVersionRequest(BaseModel):
 # Create new version with uploaded file
 @app.post("/api/drawings/{drawing_id}/versions")
 async def create_version(drawing_id: str, request: CreateVersionRequest):
-    drawing = next((d for d in DRAWINGS if d.id == drawing_id), None)
+    drawing = DRAWINGS_BY_ID.get(drawing_id)
     if not drawing:
         raise HTTPException(status_code=404, detail="Drawing not found")
 
-    creator = next((u for u in USERS if u.id == request.created_by_id), USERS[0])
-    new_version_number = len(drawing.versions) + 1
-
-    new_version = Version(
-        id=f"ver-{drawing_id}-{new_version_number}",
-        version_number=new_version_number,
-        created_at=datetime.now(),
-        created_by=creator,
-        file_url=request.file_url,
-        changes_summary=request.changes_summary,
-        status=ReviewStatus.DRAFT
-    )
-
-    drawing.versions.append(new_version)
-    drawing.current_version = new_version
-    drawing.updated_at = datetime.now()
+    creator = USERS_BY_ID.get(request.created_by_id, _DEFAULT_USER)
+    now = datetime.now(timezone.utc)
+
+    async with _drawings_lock:
+        new_version_number = next(_version_number_seq[drawing_id])
+        new_version = Version(
+            id=f"ver-{drawing_id}-{new_version_number}",
+            version_number=new_version_number,
+            created_at=now,
+            created_by=creator,
+            file_url=request.file_url,
+            changes_summary=request.changes_summary,
+            status=ReviewStatus.DRAFT
+        )
+
+        drawing.versions.append(new_version)
+        drawing.current_version = new_version
+        drawing.updated_at = now
+        _DRAWING_SUMMARY_JSON.pop(drawing.id, None)
+        _DRAWING_JSON.pop(drawing.id, None)
+        _PROJECT_JSON.pop(drawing.project_id, None)
+        _cache.invalidate("projects", "drawings", f"drawings:{drawing.project_id}")
 
     return new_version
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Mock data lives in this process, so each extra worker would serve its own
+    # copy; keep one worker unless WEB_CONCURRENCY is set explicitly.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        access_log=False,
+    )
@@ -41,6 +41,7 @@ pdfjs.GlobalWorkerOptions.workerSrc = `//unpkg.com/pdfjs-dist@${pdfjs.version}/b
 // Bold blues, technical precision, engineering-focused
 
 const API_BASE = 'http://localhost:8000/api';
+const PAGE_SIZE = 100; // server-side maximum for list endpoints
 
 // ==================== Types ====================
 
@@ -106,26 +107,71 @@ interface Project {
   created_at: string;
 }
 
+interface ProjectSummary {
+  id: string;
+  name: string;
+  description?: string;
+  drawing_count: number;
+  member_count: number;
+  created_at: string;
+}
+
+interface DrawingSummary {
+  id: string;
+  title: string;
+  description?: string;
+  project_id: string;
+  current_version: Version;
+  created_at: string;
+  updated_at: string;
+}
+
+interface Page<T> {
+  total: number;
+  offset: number;
+  limit: number;
+  data: T[];
+}
+
 // ==================== API Functions ====================
 
+// List endpoints are paginated; follow the offset until every item is loaded
+const fetchAllPages = async <T,>(url: string): Promise<T[]> => {
+  const items: T[] = [];
+  const separator = url.includes('?') ? '&' : '?';
+  while (true) {
+    const res = await fetch(`${url}${separator}offset=${items.length}&limit=${PAGE_SIZE}`);
+    const page: Page<T> = await res.json();
+    items.push(...page.data);
+    if (page.data.length === 0 || items.length >= page.total) {
+      return items;
+    }
+  }
+};
+
 const api = {
-  async getProjects(): Promise<Project[]> {
-    const res = await fetch(`${API_BASE}/projects`);
+  async getProjects(): Promise<ProjectSummary[]> {
+    return fetchAllPages<ProjectSummary>(`${API_BASE}/projects`);
+  },
+
+  async getProject(projectId: string): Promise<Project> {
+    const res = await fetch(`${API_BASE}/projects/${projectId}`);
+    if (!res.ok) {
+      throw new Error(`HTTP error! status: ${res.status}`);
+    }
     return res.json();
   },
   
-  async getDrawings(projectId?: string): Promise<Drawing[]> {
+  async getDrawings(projectId?: string): Promise<DrawingSummary[]> {
     const url = projectId ? `${API_BASE}/drawings?project_id=${projectId}` : `${API_BASE}/drawings`;
-    const res = await fetch(url);
-    return res.json();
+    return fetchAllPages<DrawingSummary>(url);
   },
   
   async getAnnotations(drawingId: string, versionId?: string): Promise<Annotation[]> {
     const url = versionId 
       ? `${API_BASE}/drawings/${drawingId}/annotations?version_id=${versionId}`
       : `${API_BASE}/drawings/${drawingId}/annotations`;
-    const res = await fetch(url);
-    return res.json();
+    return fetchAllPages<Annotation>(url);
   },
   
   async createAnnotation(data: {
@@ -169,6 +215,27 @@ const api = {
   async getCurrentUser(): Promise<User> {
     const res = await fetch(`${API_BASE}/users/me`);
     return res.json();
+  },
+
+  // Uploads are written to disk in the background; wait until the file is served.
+  // The server answers 202 until the write finishes and 404 if it failed, so
+  // keep polling while it is pending, backing off up to 2s between checks,
+  // and give up after timeoutMs in case the server's writer is stuck.
+  async waitForUpload(filename: string, timeoutMs = 60000): Promise<void> {
+    const deadline = Date.now() + timeoutMs;
+    for (let delay = 100; ; delay = Math.min(delay * 2, 2000)) {
+      const res = await fetch(`${API_BASE}/uploads/${filename}`, { method: 'HEAD' });
+      if (res.status === 200) {
+        return;
+      }
+      if (res.status !== 202) {
+        throw new Error(`Upload failed! status: ${res.status}`);
+      }
+      if (Date.now() >= deadline) {
+        throw new Error('Upload failed! still pending after timeout');
+      }
+      await new Promise(resolve => setTimeout(resolve, Math.min(delay, deadline - Date.now())));
+    }
   }
 };
 
@@ -687,10 +754,10 @@ const DrawingViewer: React.FC<{
 };
 
 const Sidebar: React.FC<{
-  projects: Project[];
+  projects: ProjectSummary[];
   selectedProject: Project | null;
   selectedDrawing: Drawing | null;
-  onSelectProject: (project: Project) => void;
+  onSelectProject: (project: ProjectSummary) => void;
   onSelectDrawing: (drawing: Drawing) => void;
 }> = ({ projects, selectedProject, selectedDrawing, onSelectProject, onSelectDrawing }) => {
   const [searchTerm, setSearchTerm] = useState('');
@@ -733,14 +800,14 @@ const Sidebar: React.FC<{
                 <Layers className="w-5 h-5 text-cyan-400" />
                 <div className="flex-1">
                   <div className="font-semibold text-white">{project.name}</div>
-                  <div className="text-xs text-slate-400">{project.drawings.length} drawings</div>
+                  <div className="text-xs text-slate-400">{project.drawing_count} drawings</div>
                 </div>
               </div>
             </button>
             
-            {selectedProject?.id === project.id && (
+            {selectedProject && selectedProject.id === project.id && (
               <div className="bg-slate-950/50">
-                {project.drawings.map((drawing) => (
+                {selectedProject.drawings.map((drawing) => (
                   <button
                     key={drawing.id}
                     onClick={() => onSelectDrawing(drawing)}
@@ -901,7 +968,7 @@ const VersionHistory: React.FC<{
 // ==================== Main App ====================
 
 const App: React.FC = () => {
-  const [projects, setProjects] = useState<Project[]>([]);
+  const [projects, setProjects] = useState<ProjectSummary[]>([]);
   const [selectedProject, setSelectedProject] = useState<Project | null>(null);
   const [selectedDrawing, setSelectedDrawing] = useState<Drawing | null>(null);
   const [annotations, setAnnotations] = useState<Annotation[]>([]);
@@ -930,15 +997,25 @@ const App: React.FC = () => {
       setCurrentUser(userData);
       
       if (projectsData.length > 0) {
-        setSelectedProject(projectsData[0]);
-        if (projectsData[0].drawings.length > 0) {
-          setSelectedDrawing(projectsData[0].drawings[0]);
+        // The list only carries summaries; fetch the full project on demand
+        const project = await api.getProject(projectsData[0].id);
+        setSelectedProject(project);
+        if (project.drawings.length > 0) {
+          setSelectedDrawing(project.drawings[0]);
         }
       }
     } catch (error) {
       console.error('Failed to load data:', error);
     }
   };
+
+  const handleSelectProject = async (summary: ProjectSummary) => {
+    try {
+      setSelectedProject(await api.getProject(summary.id));
+    } catch (error) {
+      console.error('Failed to load project:', error);
+    }
+  };
   
   const loadAnnotations = async (drawingId: string, versionId: string) => {
     try {
@@ -1039,6 +1116,7 @@ const App: React.FC = () => {
       }
 
       const uploadData = await uploadRes.json();
+      await api.waitForUpload(uploadData.filename);
 
       // Create new version with uploaded file
       const versionRes = await fetch(`${API_BASE}/drawings/${selectedDrawing.id}/versions`, {
@@ -1091,7 +1169,7 @@ const App: React.FC = () => {
           projects={projects}
           selectedProject={selectedProject}
           selectedDrawing={selectedDrawing}
-          onSelectProject={setSelectedProject}
+          onSelectProject={handleSelectProject}
           onSelectDrawing={setSelectedDrawing}
         />
         